@@ -4,33 +4,189 @@ VPN Manager for Exceleron OpenVPN Configurations
 Advanced connection manager with fuzzy matching, session management, and hooks
 """
 
-import argparse
+from __future__ import annotations
+
+import atexit
+import functools
+import hashlib
 import logging
 import os
+import pickle
 import re
-import subprocess
+import shlex
+import string
 import sys
 import time
+from collections import Counter, namedtuple
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 import click
-import yaml
-from fuzzywuzzy import fuzz, process
+
+if TYPE_CHECKING:
+    import logging.handlers
+    import subprocess
+
+# rapidfuzz, subprocess and concurrent.futures are imported where they
+# are used so commands that don't need them start faster
+
+# Parsed configs are pickled under $XDG_CACHE_HOME, keyed on
+# (version, path, mtime_ns, size) so later runs can skip YAML entirely
+_CONFIG_CACHE_VERSION = 1
+
+# Coalesce back-to-back session listings within this window (seconds)
+_SESSION_CACHE_TTL = 0.5
+_SCREEN_SESSION_RE = re.compile(r'^\s*\d+\.(\S+)', re.MULTILINE)
+
+# Only the best trigram-overlap candidates are scored by rapidfuzz
+_FUZZY_PREFILTER_SIZE = 50
+
+# Hook commands containing any of these are run through /bin/sh
+_SHELL_METACHARS = frozenset(';|&$`<>*?(){}[]~!#\n')
+
+
+# Hook config frozen at startup; argv is only used when shell is False
+HookSpec = namedtuple('HookSpec', 'name command argv shell required timeout description')
+
+def _config_cache_path(config_path: str) -> str:
+    """Get the parse cache file for a config path"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.sha1(os.path.abspath(config_path).encode()).hexdigest()
+    return os.path.join(cache_home, 'vpn-manager', f'config-{digest}.pickle')
+
+
+def _read_config_cache(cache_path: str) -> Optional[Tuple[Tuple, Dict]]:
+    """Read a (key, config) pair from the parse cache, or None"""
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, unreadable or corrupt caches are just misses
+        return None
+
+
+def _write_config_cache(cache_path: str, key: Tuple, config: Dict):
+    """Atomically replace the parse cache, ignoring failures"""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+# Background writer for log records, started by the first _QueuedLogHandler emit
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener():
+    """Flush queued log records and stop the background listener"""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
+
+
+class _QueuedLogHandler(logging.Handler):
+    """
+    Queue records for a background QueueListener that owns the file
+    handler. The queue and listener thread are only set up when the first
+    record is emitted, so commands that never log skip them entirely.
+    """
+    def __init__(self, log_file: str, formatter: logging.Formatter):
+        super().__init__()
+        self.log_file = log_file
+        self.file_formatter = formatter
+        self._queue_handler: Optional[logging.handlers.QueueHandler] = None
+    
+    def _start_listener(self):
+        """Create the queue and start the listener thread"""
+        global _LOG_LISTENER
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+        
+        file_handler = logging.FileHandler(self.log_file)
+        file_handler.setFormatter(self.file_formatter)
+        
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(log_queue)
+        self._queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        _LOG_LISTENER = QueueListener(log_queue, file_handler)
+        _LOG_LISTENER.start()
+        atexit.register(_stop_log_listener)
+    
+    def emit(self, record: logging.LogRecord):
+        # Handler.handle holds the handler lock, so setup runs only once
+        if self._queue_handler is None:
+            self._start_listener()
+        self._queue_handler.emit(record)
+
+
+class _SafeCharTable(dict):
+    """str.translate table mapping every code point outside [a-zA-Z0-9_-] to '_'"""
+    def __missing__(self, codepoint: int) -> int:
+        return self.setdefault(codepoint, ord('_'))
+
+
+_SAFE_CHARS = frozenset(map(ord, string.ascii_letters + string.digits + '_-'))
+_SAFE_TABLE = _SafeCharTable(
+    (c, c if c in _SAFE_CHARS else ord('_')) for c in range(256)
+)
 
 
 class VPNManager:
     def __init__(self, config_path: str = "/home/chase/ovpn/vpn-config.yaml"):
         self.config_path = config_path
         self.config = self._load_config()
+        self._sessions_cache: Optional[Tuple[float, Set[str]]] = None
         self.base_dir = Path(self.config['base_dir'])
+        self._build_indexes()
+        self._prepare_hooks()
+        self._compile_session_template()
         self._setup_logging()
         
     def _load_config(self) -> Dict:
-        """Load YAML configuration file"""
+        """Load YAML configuration file, reusing the parse cache when fresh"""
         try:
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
+            click.echo(f"Config file not found: {self.config_path}", err=True)
+            sys.exit(1)
+        
+        cache_path = _config_cache_path(self.config_path)
+        abs_path = os.path.abspath(self.config_path)
+        cached = _read_config_cache(cache_path)
+        if cached and cached[0] == (_CONFIG_CACHE_VERSION, abs_path, st.st_mtime_ns, st.st_size):
+            return cached[1]
+        
+        st, config = self._parse_config()
+        _write_config_cache(
+            cache_path,
+            (_CONFIG_CACHE_VERSION, abs_path, st.st_mtime_ns, st.st_size),
+            config
+        )
+        return config
+    
+    def _parse_config(self) -> Tuple[os.stat_result, Dict]:
+        """Parse the YAML config, returning the parsed file's stat and contents"""
+        import yaml
+        try:
+            # libyaml C bindings are much faster than the pure-Python parser
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
+        
+        try:
+            # Key the cache on the stat of the file actually parsed
+            with open(self.config_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                return st, yaml.load(f, Loader=Loader)
         except FileNotFoundError:
             click.echo(f"Config file not found: {self.config_path}", err=True)
             sys.exit(1)
@@ -38,122 +194,266 @@ class VPNManager:
             click.echo(f"Error parsing config file: {e}", err=True)
             sys.exit(1)
     
+    def _build_indexes(self):
+        """Precompute profile lookup tables and fuzzy suggestion choices"""
+        self._resolve_index: Dict[str, Tuple[str, str, str]] = {}
+        self._all_choices: List[str] = []
+        location_keys: List[Tuple[str, Tuple[str, str, str]]] = []
+        
+        for location, loc_config in self.config['profiles'].items():
+            for network, net_config in loc_config['networks'].items():
+                file_path = self.base_dir / loc_config['directory'] / net_config['file']
+                entry = (location, network, str(file_path))
+                aliases = net_config.get('aliases') or []
+                
+                # First match wins, mirroring config iteration order
+                for name in [network] + aliases:
+                    self._resolve_index.setdefault(self._normalize_profile_key(name), entry)
+                    location_keys.append((self._normalize_profile_key(f"{location} {name}"), entry))
+                
+                self._all_choices.append(f"{location} {network}")
+                for alias in aliases:
+                    self._all_choices.append(f"{location} {alias}")
+        
+        # "<location> <network|alias>" keys rank below bare network/alias names
+        for key, entry in location_keys:
+            self._resolve_index.setdefault(key, entry)
+        
+        # Inverted trigram index over suggestion choices
+        self._choice_trigrams: Dict[str, Set[int]] = {}
+        for i, choice in enumerate(self._all_choices):
+            for gram in self._trigrams(choice):
+                self._choice_trigrams.setdefault(gram, set()).add(i)
+    
+    @staticmethod
+    def _normalize_profile_key(text) -> str:
+        """Lowercase and collapse whitespace for profile lookups"""
+        return ' '.join(str(text).lower().split())
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Get the padded, lowercased 3-grams of a string"""
+        padded = f"  {text.lower()} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def _prepare_hooks(self):
+        """Freeze hook config into HookSpec tuples with pre-split commands"""
+        hooks_config = self.config.get('hooks') or {}
+        if not isinstance(hooks_config, dict):
+            click.echo("Invalid hooks config: expected a mapping of hook types", err=True)
+            sys.exit(1)
+        self._parallel_hooks = bool(hooks_config.get('parallel', False))
+        self._hooks: Dict[str, List[HookSpec]] = {}
+        for hook_type, hooks in hooks_config.items():
+            if hook_type == 'parallel':
+                continue
+            specs = []
+            for i, hook in enumerate(hooks or [], 1):
+                try:
+                    command = hook['command']
+                    argv, needs_shell = self._split_hook_command(command)
+                    specs.append(HookSpec(
+                        hook['name'],
+                        command,
+                        argv,
+                        needs_shell,
+                        hook.get('required', False),
+                        hook.get('timeout', 30),
+                        hook.get('description', '')
+                    ))
+                except KeyError as e:
+                    click.echo(f"Invalid {hook_type} hook #{i}: missing {e}", err=True)
+                    sys.exit(1)
+                except (TypeError, AttributeError):
+                    click.echo(f"Invalid {hook_type} hook #{i}: expected a mapping with "
+                               f"string 'name' and 'command'", err=True)
+                    sys.exit(1)
+            self._hooks[hook_type] = specs
+    
+    @staticmethod
+    def _split_hook_command(command: str) -> Tuple[List[str], bool]:
+        """Return (argv, needs_shell) for a hook command"""
+        if _SHELL_METACHARS.intersection(command):
+            return [], True
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return [], True
+        # Empty commands and leading VAR=value assignments need the shell
+        if not argv or '=' in argv[0]:
+            return [], True
+        return argv, False
+    
+    def _compile_session_template(self):
+        """Resolve the session name template once into a callable"""
+        try:
+            template = str(self.config['session']['name_template'])
+        except (KeyError, TypeError):
+            click.echo("Config is missing session.name_template", err=True)
+            sys.exit(1)
+        try:
+            fields = list(string.Formatter().parse(template))
+            # Surface unknown fields or bad format specs now, not mid-connect
+            template.format(profile_safe='')
+        except KeyError as e:
+            click.echo(f"Invalid session name template {template!r}: unknown field {e}", err=True)
+            sys.exit(1)
+        except (IndexError, ValueError) as e:
+            click.echo(f"Invalid session name template {template!r}: {e}", err=True)
+            sys.exit(1)
+        
+        # Plain "prefix{profile_safe}suffix" templates become concatenation
+        if (fields and fields[0][1] == 'profile_safe' and not fields[0][2] and not fields[0][3]
+                and all(field[1] is None for field in fields[1:])):
+            prefix = fields[0][0]
+            suffix = ''.join(field[0] for field in fields[1:])
+            self._session_name_fn = lambda profile_safe: prefix + profile_safe + suffix
+        else:
+            self._session_name_fn = functools.partial(self._format_session_name, template)
+    
+    @staticmethod
+    def _format_session_name(template: str, profile_safe: str) -> str:
+        """Format a session name template that needs the full format machinery"""
+        return template.format(profile_safe=profile_safe)
+    
     def _setup_logging(self):
         """Setup logging configuration"""
         log_config = self.config.get('logging', {})
         log_file = log_config.get('file', '/tmp/vpn-manager.log')
         log_level = getattr(logging, log_config.get('level', 'INFO'))
         
+        # File writes are queued to a background listener to keep them off
+        # the hot path. The stream handler stays synchronous so console
+        # output keeps its order relative to click.echo.
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
         logging.basicConfig(
             level=log_level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
+                stream_handler,
+                _QueuedLogHandler(log_file, formatter)
             ]
         )
         self.logger = logging.getLogger(__name__)
     
     def _make_profile_safe(self, profile: str) -> str:
         """Convert profile name to safe session name"""
-        return re.sub(r'[^a-zA-Z0-9_-]', '_', profile)
+        return profile.translate(_SAFE_TABLE)
     
     def _resolve_profile(self, input_str: str) -> Optional[Tuple[str, str, str]]:
         """
         Resolve fuzzy input to location/network/file
         Returns (location, network, file_path) or None
         """
-        # Try exact match first
-        for location, loc_config in self.config['profiles'].items():
-            for network, net_config in loc_config['networks'].items():
-                # Check exact network name
-                if network == input_str:
-                    file_path = self.base_dir / loc_config['directory'] / net_config['file']
-                    return location, network, str(file_path)
-                
-                # Check aliases
-                for alias in net_config.get('aliases', []):
-                    if alias == input_str:
-                        file_path = self.base_dir / loc_config['directory'] / net_config['file']
-                        return location, network, str(file_path)
-        
-        # Try location + network fuzzy matching
-        parts = input_str.split()
-        if len(parts) >= 2:
-            location_part = parts[0]
-            network_part = ' '.join(parts[1:])
-            
-            # Simple exact match instead of fuzzy match to avoid Click issues
-            if location_part in self.config['profiles']:
-                location = location_part
-                loc_config = self.config['profiles'][location]
-                
-                # Check for exact network match or alias match
-                for network, net_config in loc_config['networks'].items():
-                    if network == network_part or network_part in net_config.get('aliases', []):
-                        file_path = self.base_dir / loc_config['directory'] / net_config['file']
-                        return location, network, str(file_path)
+        # Exact network/alias or "<location> <network|alias>" match
+        resolved = self._resolve_index.get(self._normalize_profile_key(input_str))
+        if resolved:
+            return resolved
         
         # Fuzzy matching disabled due to Click interaction issues
         # TODO: Implement safer fuzzy matching that doesn't interfere with Click
         return None
     
+    @functools.lru_cache(maxsize=None)
     def _get_session_name(self, location: str, network: str) -> str:
         """Generate session name from template"""
         profile = f"{location}_{network}"
         profile_safe = self._make_profile_safe(profile)
-        return self.config['session']['name_template'].format(profile_safe=profile_safe)
+        return self._session_name_fn(profile_safe)
     
-    def _run_hooks(self, hook_type: str) -> bool:
-        """Run hooks of specified type"""
-        hooks = self.config['hooks'].get(hook_type, [])
-        for hook in hooks:
-            name = hook['name']
-            command = hook['command']
-            required = hook.get('required', False)
-            description = hook.get('description', '')
-            
-            self.logger.info(f"Running {hook_type} hook: {name} - {description}")
+    def _exec_hook(self, hook: HookSpec) -> subprocess.CompletedProcess:
+        """Execute a hook command, only spawning a shell when needed"""
+        import subprocess
+        if not hook.shell:
             try:
-                result = subprocess.run(
-                    command,
-                    shell=True,
+                return subprocess.run(
+                    hook.argv,
+                    stdin=subprocess.DEVNULL,
                     capture_output=True,
                     text=True,
-                    timeout=30
+                    timeout=hook.timeout
                 )
-                if result.returncode != 0:
-                    error_msg = f"Hook {name} failed: {result.stderr}"
-                    self.logger.error(error_msg)
-                    if required:
-                        click.echo(f"Required hook failed: {error_msg}", err=True)
-                        return False
-                    else:
-                        click.echo(f"Optional hook failed: {error_msg}", err=True)
-                else:
-                    self.logger.info(f"Hook {name} completed successfully")
-            except subprocess.TimeoutExpired:
-                error_msg = f"Hook {name} timed out"
-                self.logger.error(error_msg)
-                if required:
-                    click.echo(f"Required hook timed out: {error_msg}", err=True)
-                    return False
-                else:
-                    click.echo(f"Optional hook timed out: {error_msg}", err=True)
-            except Exception as e:
-                error_msg = f"Hook {name} error: {e}"
+            except FileNotFoundError:
+                # Not an executable on PATH (e.g. a shell builtin), let sh handle it
+                pass
+        return subprocess.run(
+            hook.command,
+            shell=True,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=hook.timeout
+        )
+    
+    def _run_hook(self, hook_type: str, hook: HookSpec) -> bool:
+        """Run a single hook, returning False if a required hook failed"""
+        import subprocess
+        name, required, description = hook.name, hook.required, hook.description
+        
+        self.logger.info(f"Running {hook_type} hook: {name} - {description}")
+        try:
+            result = self._exec_hook(hook)
+            if result.returncode != 0:
+                error_msg = f"Hook {name} failed: {result.stderr}"
                 self.logger.error(error_msg)
                 if required:
-                    click.echo(f"Required hook error: {error_msg}", err=True)
+                    click.echo(f"Required hook failed: {error_msg}", err=True)
                     return False
                 else:
-                    click.echo(f"Optional hook error: {error_msg}", err=True)
+                    click.echo(f"Optional hook failed: {error_msg}", err=True)
+            else:
+                self.logger.info(f"Hook {name} completed successfully")
+        except subprocess.TimeoutExpired:
+            error_msg = f"Hook {name} timed out"
+            self.logger.error(error_msg)
+            if required:
+                click.echo(f"Required hook timed out: {error_msg}", err=True)
+                return False
+            else:
+                click.echo(f"Optional hook timed out: {error_msg}", err=True)
+        except Exception as e:
+            error_msg = f"Hook {name} error: {e}"
+            self.logger.error(error_msg)
+            if required:
+                click.echo(f"Required hook error: {error_msg}", err=True)
+                return False
+            else:
+                click.echo(f"Optional hook error: {error_msg}", err=True)
         
         return True
     
-    def _check_session_exists(self, session_name: str) -> bool:
-        """Check if session exists"""
+    def _run_hooks(self, hook_type: str) -> bool:
+        """Run hooks of specified type"""
+        hooks = self._hooks.get(hook_type, ())
+        optional = [hook for hook in hooks if not hook.required]
+        
+        if not self._parallel_hooks or not optional:
+            for hook in hooks:
+                if not self._run_hook(hook_type, hook):
+                    return False
+            return True
+        
+        from concurrent.futures import ThreadPoolExecutor, wait
+        
+        # Optional hooks run concurrently while required hooks run serially
+        required = [hook for hook in hooks if hook.required]
+        with ThreadPoolExecutor(max_workers=min(8, len(optional))) as executor:
+            futures = [executor.submit(self._run_hook, hook_type, hook) for hook in optional]
+            success = all(self._run_hook(hook_type, hook) for hook in required)
+            wait(futures)
+        
+        return success
+    
+    def _list_sessions(self) -> Set[str]:
+        """Get names of all live sessions with a single screen/tmux call"""
+        import subprocess
+        now = time.monotonic()
+        if self._sessions_cache and now - self._sessions_cache[0] < _SESSION_CACHE_TTL:
+            return self._sessions_cache[1]
+        
         session_type = self.config['session']['type']
+        sessions: Set[str] = set()
         try:
             if session_type == 'screen':
                 result = subprocess.run(
@@ -161,26 +461,46 @@ class VPNManager:
                     capture_output=True,
                     text=True
                 )
-                # Use word boundary matching to avoid substring matches
-                import re
-                pattern = rf'\b{re.escape(session_name)}\b'
-                return bool(re.search(pattern, result.stdout))
+                sessions = set(_SCREEN_SESSION_RE.findall(result.stdout))
             elif session_type == 'tmux':
                 result = subprocess.run(
-                    ['tmux', 'list-sessions'],
+                    ['tmux', 'list-sessions', '-F', '#{session_name}'],
                     capture_output=True,
                     text=True
                 )
-                # Use word boundary matching to avoid substring matches
-                import re
-                pattern = rf'\b{re.escape(session_name)}\b'
-                return bool(re.search(pattern, result.stdout))
+                if result.returncode == 0:
+                    sessions = set(result.stdout.splitlines())
         except Exception:
-            return False
-        return False
+            pass
+        
+        self._sessions_cache = (now, sessions)
+        return sessions
+    
+    def _invalidate_sessions(self):
+        """Drop cached session listing after starting or killing a session"""
+        self._sessions_cache = None
+    
+    def _check_session_exists(self, session_name: str) -> bool:
+        """Check if session exists"""
+        if self.config['session']['type'] == 'tmux':
+            import subprocess
+            try:
+                # '=' forces an exact session name match
+                result = subprocess.run(
+                    ['tmux', 'has-session', '-t', f'={session_name}'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                return result.returncode == 0
+            except Exception:
+                return False
+        # screen has no reliable per-session exit status, use the listing
+        return session_name in self._list_sessions()
     
     def _kill_session(self, session_name: str) -> bool:
         """Kill existing session"""
+        import subprocess
+        self._invalidate_sessions()
         session_type = self.config['session']['type']
         try:
             if session_type == 'screen':
@@ -201,6 +521,7 @@ class VPNManager:
     
     def connect(self, profile_input: str) -> bool:
         """Connect to VPN profile"""
+        import subprocess
         # Resolve profile
         resolved = self._resolve_profile(profile_input)
         if not resolved:
@@ -214,10 +535,13 @@ class VPNManager:
         
         location, network, file_path = resolved
         
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Check if file exists, keeping the stat result for logging
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
             click.echo(f"VPN config file not found: {file_path}", err=True)
             return False
+        self.logger.debug(f"Using VPN config {file_path} ({file_stat.st_size} bytes)")
         
         session_name = self._get_session_name(location, network)
         
@@ -241,7 +565,18 @@ class VPNManager:
                     cmd.extend(['-d', '-m'])
                 cmd.extend(['-S', session_name, 'sudo', 'openvpn', '--config', file_path])
                 
+                if not daemon_mode:
+                    # Foreground mode: replace this process with the attached
+                    # screen session. Post-connect hooks require daemon mode.
+                    click.echo(f"Starting VPN connection: {location} {network}")
+                    click.echo(f"Session: {session_name}")
+                    sys.stdout.flush()
+                    _stop_log_listener()
+                    os.chdir(self.base_dir)
+                    os.execvp('screen', cmd)
+                
                 result = subprocess.run(cmd, cwd=str(self.base_dir))
+                self._invalidate_sessions()
                 if result.returncode == 0:
                     click.echo(f"Started VPN connection: {location} {network}")
                     click.echo(f"Session: {session_name}")
@@ -259,6 +594,7 @@ class VPNManager:
                        'sudo', 'openvpn', '--config', file_path]
                 
                 result = subprocess.run(cmd, cwd=str(self.base_dir))
+                self._invalidate_sessions()
                 if result.returncode == 0:
                     click.echo(f"Started VPN connection: {location} {network}")
                     click.echo(f"Session: {session_name}")
@@ -283,7 +619,7 @@ class VPNManager:
         net_config = loc_config['networks'][network]
         
         # Check if this specific session already exists
-        if self._check_session_exists(session_name):
+        if session_name in self._list_sessions():
             if not net_config.get('allow_multiple', False):
                 click.echo(f"Connection already exists: {location} {network}")
                 response = click.confirm("Kill existing connection and reconnect?")
@@ -316,34 +652,42 @@ class VPNManager:
         """Get all active sessions for a location"""
         sessions = []
         loc_config = self.config['profiles'][location]
+        live_sessions = self._list_sessions()
         
         for network in loc_config['networks'].keys():
             session_name = self._get_session_name(location, network)
-            if self._check_session_exists(session_name):
+            if session_name in live_sessions:
                 sessions.append(session_name)
         
         return sessions
     
     def _get_suggestions(self, input_str: str) -> List[str]:
         """Get fuzzy match suggestions"""
-        all_choices = []
-        for location, loc_config in self.config['profiles'].items():
-            for network, net_config in loc_config['networks'].items():
-                all_choices.append(f"{location} {network}")
-                for alias in net_config.get('aliases', []):
-                    all_choices.append(f"{location} {alias}")
+        from rapidfuzz import fuzz, process, utils
+        
+        # Narrow large choice lists to those sharing the most trigrams
+        choices = self._all_choices
+        if len(choices) > _FUZZY_PREFILTER_SIZE:
+            overlap = Counter()
+            for gram in self._trigrams(input_str):
+                overlap.update(self._choice_trigrams.get(gram, ()))
+            if overlap:
+                choices = [choices[i] for i, _ in overlap.most_common(_FUZZY_PREFILTER_SIZE)]
         
         matches = process.extract(
             input_str,
-            all_choices,
-            scorer=fuzz.ratio,
-            limit=self.config['fuzzy_matching']['max_suggestions']
+            choices,
+            scorer=fuzz.token_set_ratio,
+            processor=utils.default_process,  # Case-insensitive like fuzzywuzzy
+            limit=self.config['fuzzy_matching']['max_suggestions'],
+            score_cutoff=50  # Lower threshold for suggestions
         )
         
-        return [match[0] for match in matches if match[1] >= 50]  # Lower threshold for suggestions
+        return [match[0] for match in matches]
     
     def disconnect(self, profile_input: str = None) -> bool:
         """Disconnect VPN profile(s)"""
+        import subprocess
         if profile_input:
             # Disconnect specific profile
             self.logger.info(f"Attempting to disconnect profile: '{profile_input}'")
@@ -389,6 +733,7 @@ class VPNManager:
     
     def status(self) -> bool:
         """Show status of VPN connections"""
+        import subprocess
         session_type = self.config['session']['type']
         active_sessions = []
         
@@ -400,8 +745,9 @@ class VPNManager:
                 all_sessions.append((location, network, session_name))
         
         # Check which sessions are active
+        live_sessions = self._list_sessions()
         for location, network, session_name in all_sessions:
-            if self._check_session_exists(session_name):
+            if session_name in live_sessions:
                 active_sessions.append((location, network, session_name))
         
         if not active_sessions:
@@ -457,10 +803,11 @@ class VPNManager:
         if not profile_input:
             # Show active sessions and let user choose
             active_sessions = []
+            live_sessions = self._list_sessions()
             for location, loc_config in self.config['profiles'].items():
                 for network in loc_config['networks'].keys():
                     session_name = self._get_session_name(location, network)
-                    if self._check_session_exists(session_name):
+                    if session_name in live_sessions:
                         active_sessions.append((location, network, session_name))
             
             if not active_sessions:
@@ -494,6 +841,7 @@ class VPNManager:
         
         # Execute screen -rd to attach to the session
         try:
+            _stop_log_listener()
             os.execvp('screen', ['screen', '-rd', session_name])
         except Exception as e:
             click.echo(f"Failed to attach to session: {e}", err=True)
@@ -538,9 +886,9 @@ def status(ctx):
     sys.exit(0 if success else 1)
 
 
-@cli.command()
+@cli.command(name='list')
 @click.pass_context
-def list(ctx):
+def list_profiles(ctx):
     """List all available VPN profiles"""
     manager = ctx.obj['manager']
     success = manager.list_profiles()